@@ -9,49 +9,69 @@ import sys
 import re
 from pathlib import Path
 
+# Frontmatter must open on the first line and close on a line that is exactly ---
+_FRONTMATTER_RE = re.compile(r'(?ms)\A---$(.*?)^---$')
+_VIEW_TRANSITIONS = 'ViewTransitions'
+_VIEW_TRANSITIONS_IMPORT = "import { ViewTransitions } from 'astro:transitions';"
+_VIEW_TRANSITIONS_TAG = '    <ViewTransitions />\n  </head>'
+_HEAD_OPEN = '<head>'
+_HEAD_CLOSE = '</head>'
+
+def _read_utf8(path: str) -> str:
+    """Read a small UTF-8 file in one os.read, normalizing line endings to \\n"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size).decode('utf-8')
+    finally:
+        os.close(fd)
+    # Match the universal-newline translation read_text() used to do
+    return data.replace('\r\n', '\n').replace('\r', '\n')
+
+def _write_utf8(path: str, data: str):
+    """Write a UTF-8 file with os.write, truncating any existing content"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data.encode('utf-8'))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 def add_view_transitions(layout_file: Path):
-    """Add View Transitions to a layout file"""
-    
-    if not layout_file.exists():
-        print(f"❌ Error: Layout file not found: {layout_file}")
-        return False
+    """Add View Transitions to a layout file, returning the updated content or None"""
     
-    content = layout_file.read_text()
+    content = _read_utf8(str(layout_file))
     
     # Check if already has View Transitions
-    if 'ViewTransitions' in content:
+    if _VIEW_TRANSITIONS in content:
         print(f"⚠️  {layout_file.name} already has View Transitions")
-        return False
+        return None
     
     # Add import at the top of frontmatter
-    if content.startswith('---'):
-        # Find the end of frontmatter
-        match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if match:
-            frontmatter = match.group(1)
-            # Add import
-            new_frontmatter = f"import {{ ViewTransitions }} from 'astro:transitions';\n{frontmatter}"
-            content = content.replace(match.group(0), f"---\n{new_frontmatter}\n---", 1)
+    match = _FRONTMATTER_RE.search(content)
+    if match:
+        # The captured body keeps its surrounding newlines, so empty frontmatter is just "\n"
+        frontmatter = match.group(1)
+        # Add import
+        content = f"---\n{_VIEW_TRANSITIONS_IMPORT}{frontmatter}---{content[match.end():]}"
+    elif content.startswith('---'):
+        print(f"⚠️  Could not find closing frontmatter delimiter in {layout_file.name}")
+        return None
     else:
         # No frontmatter, add it
-        content = f"---\nimport {{ ViewTransitions }} from 'astro:transitions';\n---\n\n{content}"
+        content = f"---\n{_VIEW_TRANSITIONS_IMPORT}\n---\n\n{content}"
     
     # Add ViewTransitions component to <head>
-    if '<head>' in content:
-        content = content.replace('</head>', '    <ViewTransitions />\n  </head>', 1)
+    if _HEAD_OPEN in content:
+        content = content.replace(_HEAD_CLOSE, _VIEW_TRANSITIONS_TAG, 1)
     else:
         print(f"⚠️  No <head> tag found in {layout_file.name}")
-        return False
+        return None
     
-    # Write back
-    layout_file.write_text(content)
-    print(f"✅ Added View Transitions to {layout_file.name}")
-    return True
+    return content
 
-def add_transition_directives(layout_file: Path):
-    """Add helpful transition directives as comments"""
-    
-    content = layout_file.read_text()
+def add_transition_directives(content: str):
+    """Add helpful transition directives as comments, returning the updated content"""
     
     # Add comments about transition directives if not present
     if 'transition:' not in content:
@@ -64,10 +84,29 @@ def add_transition_directives(layout_file: Path):
 -->
 '''
         # Add before closing </head>
-        if '</head>' in content:
-            content = content.replace('</head>', f'{hints}  </head>', 1)
-            layout_file.write_text(content)
-            print(f"✅ Added transition directive hints to {layout_file.name}")
+        if _HEAD_CLOSE in content:
+            content = content.replace(_HEAD_CLOSE, f'{hints}  {_HEAD_CLOSE}', 1)
+    
+    return content
+
+def write_layout(layout_file: Path, content: str):
+    """Write the layout once, replacing the original atomically"""
+    
+    # Replace the file a symlinked layout points at, not the link itself
+    target = Path(os.path.realpath(layout_file))
+    tmp_file = target.with_name(f".{target.name}.tmp")
+    mode = os.stat(str(target)).st_mode
+    try:
+        _write_utf8(str(tmp_file), content)
+        # Keep the original permissions rather than the temp file's defaults
+        os.chmod(str(tmp_file), mode & 0o7777)
+        os.replace(str(tmp_file), str(target))
+    except BaseException:
+        try:
+            os.unlink(str(tmp_file))
+        except FileNotFoundError:
+            pass
+        raise
 
 def main():
     if not os.path.exists("package.json"):
@@ -82,7 +121,10 @@ def main():
         print("   Create a layout first, then run this script")
         sys.exit(1)
     
-    layout_files = list(layouts_dir.glob("*.astro"))
+    # Entries come straight from scandir, so they are known to exist
+    with os.scandir(layouts_dir) as it:
+        layout_files = [Path(entry.path) for entry in it
+                        if entry.name.endswith(".astro") and entry.is_file()]
     
     if not layout_files:
         print("❌ Error: No .astro layout files found in src/layouts/")
@@ -96,8 +138,13 @@ def main():
     
     success_count = 0
     for layout_file in layout_files:
-        if add_view_transitions(layout_file):
-            add_transition_directives(layout_file)
+        content = add_view_transitions(layout_file)
+        if content is not None:
+            hinted = add_transition_directives(content)
+            write_layout(layout_file, hinted)
+            print(f"✅ Added View Transitions to {layout_file.name}")
+            if hinted != content:
+                print(f"✅ Added transition directive hints to {layout_file.name}")
             success_count += 1
     
     if success_count > 0:
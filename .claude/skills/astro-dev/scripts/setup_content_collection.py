@@ -7,17 +7,11 @@ Creates a new content collection with TypeScript schema
 import os
 import sys
 from pathlib import Path
+from string import Template
 
-def create_content_collection(collection_name: str, schema_type: str = "blog"):
-    """Create a content collection with schema"""
-    
-    # Create collection directory
-    collection_dir = Path(f"src/content/{collection_name}")
-    collection_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Define schema templates
-    schemas = {
-        "blog": '''import { z, defineCollection } from 'astro:content';
+# Schema templates, keyed by collection type
+_SCHEMAS = {
+    "blog": Template('''import { z, defineCollection } from 'astro:content';
 
 const blogCollection = defineCollection({
   type: 'content',
@@ -36,9 +30,9 @@ const blogCollection = defineCollection({
 });
 
 export const collections = {
-  '%(name)s': blogCollection,
-};''',
-        "docs": '''import { z, defineCollection } from 'astro:content';
+  '${name}': blogCollection,
+};'''),
+    "docs": Template('''import { z, defineCollection } from 'astro:content';
 
 const docsCollection = defineCollection({
   type: 'content',
@@ -53,9 +47,9 @@ const docsCollection = defineCollection({
 });
 
 export const collections = {
-  '%(name)s': docsCollection,
-};''',
-        "products": '''import { z, defineCollection } from 'astro:content';
+  '${name}': docsCollection,
+};'''),
+    "products": Template('''import { z, defineCollection } from 'astro:content';
 
 const productsCollection = defineCollection({
   type: 'data',
@@ -72,13 +66,20 @@ const productsCollection = defineCollection({
 });
 
 export const collections = {
-  '%(name)s': productsCollection,
-};''',
-    }
+  '${name}': productsCollection,
+};'''),
+}
+
+def create_content_collection(collection_name: str, schema_type: str = "blog"):
+    """Create a content collection with schema"""
+    
+    # Create collection directory
+    collection_dir = Path(f"src/content/{collection_name}")
+    collection_dir.mkdir(parents=True, exist_ok=True)
     
     # Get schema template
-    schema_template = schemas.get(schema_type, schemas["blog"])
-    schema_content = schema_template % {"name": collection_name}
+    schema_template = _SCHEMAS.get(schema_type, _SCHEMAS["blog"])
+    schema_content = schema_template.substitute(name=collection_name)
     
     # Create config file
     config_file = Path("src/content/config.ts")
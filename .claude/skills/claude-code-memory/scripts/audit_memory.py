@@ -12,10 +12,99 @@ Checks for:
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Union
 from datetime import datetime, timedelta
 import json
 
+_TODO_MARKER = b"TODO"
+_TODO_LIMIT = 5
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Reusable read buffers (one per worker thread) for scanning files without decoding them
+_thread_buffers = threading.local()
+
+def _read_buffer():
+    """Return this thread's reusable read buffer and a memoryview over it."""
+    if not hasattr(_thread_buffers, "buf"):
+        _thread_buffers.buf = bytearray(65536)
+        _thread_buffers.view = memoryview(_thread_buffers.buf)
+    return _thread_buffers.buf, _thread_buffers.view
+
+def count_todos(file_path: Union[str, Path], stop_after: Optional[int] = None) -> int:
+    """Count TODO markers in a file using a reused binary buffer.
+    
+    If stop_after is given, scanning stops as soon as the count exceeds it.
+    """
+    buf, view = _read_buffer()
+    count = 0
+    keep = 0
+    marker_len = len(_TODO_MARKER)
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(view[keep:])
+            if not n:
+                break
+            end = keep + n
+            pos = buf.find(_TODO_MARKER, 0, end)
+            while pos >= 0:
+                count += 1
+                if stop_after is not None and count > stop_after:
+                    return count
+                pos = buf.find(_TODO_MARKER, pos + marker_len, end)
+            # Carry the tail forward so a marker split across reads is still seen
+            keep = min(end, marker_len - 1)
+            buf[:keep] = buf[end - keep:end]
+    return count
+
+def scan_memory_files(memory_dir: Path):
+    """Walk the memory tree once, reusing each DirEntry's cached stat.
+    
+    Returns a list of (relative_path, path, stat_result) tuples for every
+    markdown file, plus the number of markdown files directly in the root.
+    """
+    root = str(memory_dir)
+    prefix_len = len(root) + 1
+    memory_files = []
+    root_file_count = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            # Skip unreadable directories, as pathlib's glob does
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    memory_files.append((entry.path[prefix_len:], entry.path, entry.stat()))
+                    if current == root:
+                        root_file_count += 1
+    return memory_files, root_file_count
+
+def has_many_todos(file_path: Union[str, Path]) -> bool:
+    """Whether a file has more TODO markers than the redundancy threshold."""
+    return count_todos(file_path, stop_after=_TODO_LIMIT) > _TODO_LIMIT
+
+def write_json_report(json_output: Path, buckets: dict, organization_issues: list, stats: dict):
+    """Stream the report to JSON, turning each column bucket into a list of records."""
+    with open(json_output, 'w') as f:
+        f.write("{")
+        for name, columns in buckets.items():
+            keys = list(columns)
+            f.write(f"\n  {json.dumps(name)}: [")
+            for i, row in enumerate(zip(*columns.values())):
+                f.write(",\n    " if i else "\n    ")
+                f.write(json.dumps(dict(zip(keys, row))))
+            f.write("\n  ]," if columns[keys[0]] else "],")
+        f.write(f'\n  "organization_issues": {json.dumps(organization_issues)},')
+        f.write(f'\n  "stats": {json.dumps(stats)}\n}}\n')
+
 def audit_memory_directory(memory_dir: Path):
     """Audit all memory files in the directory."""
     
@@ -23,15 +112,13 @@ def audit_memory_directory(memory_dir: Path):
         print(f"❌ Memory directory not found: {memory_dir}")
         return
     
-    issues = {
-        "stale_files": [],
-        "large_files": [],
-        "redundancy_warnings": [],
-        "organization_issues": [],
-        "stats": {}
-    }
+    # Per-file findings are kept as parallel columns rather than lists of dicts
+    stale = {"file": [], "last_modified": [], "age_days": []}
+    large = {"file": [], "size": [], "size_kb": []}
+    redundancy = {"file": [], "issue": []}
+    organization_issues = []
     
-    memory_files = list(memory_dir.glob("**/*.md"))
+    memory_files, root_file_count = scan_memory_files(memory_dir)
     
     if not memory_files:
         print(f"⚠️  No memory files found in {memory_dir}")
@@ -39,49 +126,46 @@ def audit_memory_directory(memory_dir: Path):
     
     print(f"📊 Auditing {len(memory_files)} memory files...\n")
     
+    # Reading files for TODO markers is I/O bound, so overlap it across threads;
+    # results come back in order and are aggregated here on the main thread
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        todo_flags = list(executor.map(has_many_todos, [path for _, path, _ in memory_files]))
+    
     # Check each file
     total_size = 0
-    for file_path in memory_files:
-        file_size = file_path.stat().st_size
+    now = datetime.now()
+    for (rel_path, _, st), many_todos in zip(memory_files, todo_flags):
+        file_size = st.st_size
         total_size += file_size
         
         # Check file size
         if file_size > 50000:  # ~50KB
-            issues["large_files"].append({
-                "file": str(file_path.relative_to(memory_dir)),
-                "size": file_size,
-                "size_kb": round(file_size / 1024, 1)
-            })
+            large["file"].append(rel_path)
+            large["size"].append(file_size)
+            large["size_kb"].append(round(file_size / 1024, 1))
         
         # Check modification time
-        mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-        age_days = (datetime.now() - mtime).days
+        mtime = datetime.fromtimestamp(st.st_mtime)
+        age_days = (now - mtime).days
         
         if age_days > 60:  # Haven't been updated in 2+ months
-            issues["stale_files"].append({
-                "file": str(file_path.relative_to(memory_dir)),
-                "last_modified": mtime.strftime("%Y-%m-%d"),
-                "age_days": age_days
-            })
+            stale["file"].append(rel_path)
+            stale["last_modified"].append(mtime.strftime("%Y-%m-%d"))
+            stale["age_days"].append(age_days)
         
         # Check for common redundancy patterns
-        content = file_path.read_text()
-        if content.count("TODO") > 5:
-            issues["redundancy_warnings"].append({
-                "file": str(file_path.relative_to(memory_dir)),
-                "issue": "Contains many TODO items (consider consolidating)"
-            })
+        if many_todos:
+            redundancy["file"].append(rel_path)
+            redundancy["issue"].append("Contains many TODO items (consider consolidating)")
     
     # Check organization
-    if len(memory_files) > 10 and memory_dir.glob("*.md"):
-        root_files = list(memory_dir.glob("*.md"))
-        if len(root_files) > 3:
-            issues["organization_issues"].append(
-                f"Many files ({len(root_files)}) in root directory - consider organizing into subdirectories"
-            )
+    if len(memory_files) > 10 and root_file_count > 3:
+        organization_issues.append(
+            f"Many files ({root_file_count}) in root directory - consider organizing into subdirectories"
+        )
     
     # Store stats
-    issues["stats"] = {
+    stats = {
         "total_files": len(memory_files),
         "total_size_kb": round(total_size / 1024, 1),
         "avg_file_size_kb": round(total_size / len(memory_files) / 1024, 1)
@@ -93,41 +177,44 @@ def audit_memory_directory(memory_dir: Path):
     print("=" * 60)
     
     print(f"\n📈 Statistics:")
-    print(f"  • Total files: {issues['stats']['total_files']}")
-    print(f"  • Total size: {issues['stats']['total_size_kb']} KB")
-    print(f"  • Average file size: {issues['stats']['avg_file_size_kb']} KB")
-    
-    if issues["stale_files"]:
-        print(f"\n⏰ Stale Files ({len(issues['stale_files'])}):")
-        for item in issues["stale_files"]:
-            print(f"  • {item['file']}")
-            print(f"    Last modified: {item['last_modified']} ({item['age_days']} days ago)")
-    
-    if issues["large_files"]:
-        print(f"\n📦 Large Files ({len(issues['large_files'])}):")
-        for item in issues["large_files"]:
-            print(f"  • {item['file']} ({item['size_kb']} KB)")
-    
-    if issues["redundancy_warnings"]:
-        print(f"\n⚠️  Redundancy Warnings ({len(issues['redundancy_warnings'])}):")
-        for item in issues["redundancy_warnings"]:
-            print(f"  • {item['file']}: {item['issue']}")
-    
-    if issues["organization_issues"]:
+    print(f"  • Total files: {stats['total_files']}")
+    print(f"  • Total size: {stats['total_size_kb']} KB")
+    print(f"  • Average file size: {stats['avg_file_size_kb']} KB")
+    
+    if stale["file"]:
+        print(f"\n⏰ Stale Files ({len(stale['file'])}):")
+        for file, last_modified, age_days in zip(stale["file"], stale["last_modified"], stale["age_days"]):
+            print(f"  • {file}")
+            print(f"    Last modified: {last_modified} ({age_days} days ago)")
+    
+    if large["file"]:
+        print(f"\n📦 Large Files ({len(large['file'])}):")
+        for file, size_kb in zip(large["file"], large["size_kb"]):
+            print(f"  • {file} ({size_kb} KB)")
+    
+    if redundancy["file"]:
+        print(f"\n⚠️  Redundancy Warnings ({len(redundancy['file'])}):")
+        for file, issue in zip(redundancy["file"], redundancy["issue"]):
+            print(f"  • {file}: {issue}")
+    
+    if organization_issues:
         print(f"\n📁 Organization Issues:")
-        for issue in issues["organization_issues"]:
+        for issue in organization_issues:
             print(f"  • {issue}")
     
-    if not any([issues["stale_files"], issues["large_files"], 
-                issues["redundancy_warnings"], issues["organization_issues"]]):
+    if not any([stale["file"], large["file"], 
+                redundancy["file"], organization_issues]):
         print("\n✅ No issues found! Memory is in good shape.")
     
     print("\n" + "=" * 60)
     
     # Export JSON for programmatic use
     json_output = memory_dir / ".audit_report.json"
-    with open(json_output, 'w') as f:
-        json.dump(issues, f, indent=2)
+    write_json_report(json_output, {
+        "stale_files": stale,
+        "large_files": large,
+        "redundancy_warnings": redundancy,
+    }, organization_issues, stats)
     print(f"\n💾 Detailed report saved to: {json_output}")
 
 if __name__ == "__main__":
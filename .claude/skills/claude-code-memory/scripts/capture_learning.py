@@ -12,31 +12,32 @@ from pathlib import Path
 from datetime import datetime
 import json
 
-def create_learning_entry(memory_dir: Path, category: str, title: str, 
-                         problem: str, solution: str, context: str = ""):
-    """Create a structured learning entry in the memory system."""
-    
-    learnings_dir = memory_dir / "learnings"
-    learnings_dir.mkdir(parents=True, exist_ok=True)
-    
+CATEGORY_FILES = {
+    "build": "build_issues.md",
+    "test": "testing_issues.md",
+    "deploy": "deployment_issues.md",
+    "debug": "debugging_solutions.md",
+    "integration": "integration_issues.md",
+    "performance": "performance_solutions.md",
+    "tooling": "tooling_issues.md",
+    "general": "general_learnings.md"
+}
+
+def _learnings_path(memory_dir: Path, category: str) -> Path:
+    """Return the learnings file for a category without touching the filesystem."""
     # Determine the file based on category
-    category_files = {
-        "build": "build_issues.md",
-        "test": "testing_issues.md",
-        "deploy": "deployment_issues.md",
-        "debug": "debugging_solutions.md",
-        "integration": "integration_issues.md",
-        "performance": "performance_solutions.md",
-        "tooling": "tooling_issues.md",
-        "general": "general_learnings.md"
-    }
-    
-    filename = category_files.get(category.lower(), "general_learnings.md")
-    filepath = learnings_dir / filename
-    
-    # Create file if it doesn't exist
-    if not filepath.exists():
-        header = f"""# {category.title()} Learnings
+    filename = CATEGORY_FILES.get(category.lower(), "general_learnings.md")
+    return memory_dir / "learnings" / filename
+
+def learnings_file_path(memory_dir: Path, category: str) -> Path:
+    """Return the learnings file for a category, creating its directory."""
+    filepath = _learnings_path(memory_dir, category)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    return filepath
+
+def learnings_header(category: str) -> str:
+    """Header written at the top of a new learnings file."""
+    return f"""# {category.title()} Learnings
 
 Solutions to problems Claude encountered in past sessions.
 
@@ -47,7 +48,65 @@ Solutions to problems Claude encountered in past sessions.
 ---
 
 """
-        filepath.write_text(header)
+
+def _open_append_fd(path: str):
+    """Open a file for appending, returning (fd, created) where created means it is new."""
+    try:
+        return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND, 0o644), True
+    except FileExistsError:
+        return os.open(path, os.O_WRONLY | os.O_APPEND), False
+
+def _write_all(fd: int, data: bytes):
+    """Write all of data to fd, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _append_utf8(path: str, data: str, header: str = ""):
+    """Append to a file with os.write, prefixing header only if the file is new."""
+    fd, created = _open_append_fd(path)
+    if created:
+        data = header + data
+    try:
+        _write_all(fd, data.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+def open_learnings_file(memory_dir: Path, category: str):
+    """Open a category's learnings file for appending in binary mode.
+    
+    Writes the header if the file is new. Useful for keeping one handle open
+    across many entries in scripted bulk captures.
+    """
+    filepath = learnings_file_path(memory_dir, category)
+    fd, created = _open_append_fd(str(filepath))
+    try:
+        # Write the header straight to disk so other writers never see an empty new file
+        if created:
+            _write_all(fd, learnings_header(category).encode('utf-8'))
+        # Wrap the fd in a buffered handle whose name is the learnings path
+        return open(str(filepath), 'ab', opener=lambda path, flags: fd)
+    except BaseException:
+        os.close(fd)
+        raise
+
+def create_learning_entry(memory_dir: Path, category: str, title: str, 
+                         problem: str, solution: str, context: str = "",
+                         fp=None):
+    """Create a structured learning entry in the memory system.
+    
+    If fp is given it must be a binary handle from open_learnings_file()
+    for the same memory_dir and category; the entry is appended to it and
+    the handle is left open.
+    """
+    
+    if fp is not None:
+        # Pure path arithmetic, so bulk captures pay no extra syscalls per entry
+        filepath = _learnings_path(memory_dir, category)
+        if Path(fp.name) != filepath:
+            raise ValueError(f"fp is open on {fp.name}, not the {category!r} learnings file {filepath}")
+    else:
+        filepath = learnings_file_path(memory_dir, category)
     
     # Format the new entry
     timestamp = datetime.now().strftime("%Y-%m-%d")
@@ -70,9 +129,12 @@ Solutions to problems Claude encountered in past sessions.
     
     entry += "\n---\n\n"
     
-    # Append to file
-    with open(filepath, 'a') as f:
-        f.write(entry)
+    if fp is not None:
+        fp.write(entry.encode('utf-8'))
+        return filepath
+    
+    # Create the file with its header in the same write, or append to it
+    _append_utf8(str(filepath), entry, header=learnings_header(category))
     
     return filepath
 
@@ -141,9 +203,12 @@ def interactive_capture():
     print(f"   - See `.claude/memory/learnings/{filepath.name}` for known issues and solutions")
 
 def quick_capture(memory_dir: Path, category: str, title: str, 
-                 problem: str, solution: str, context: str = ""):
-    """Quick non-interactive capture for scripting."""
-    filepath = create_learning_entry(memory_dir, category, title, problem, solution, context)
+                 problem: str, solution: str, context: str = "", fp=None):
+    """Quick non-interactive capture for scripting.
+    
+    Pass fp from open_learnings_file() to reuse one handle across a loop.
+    """
+    filepath = create_learning_entry(memory_dir, category, title, problem, solution, context, fp)
     print(f"✅ Learning saved to: {filepath}")
     return filepath
 